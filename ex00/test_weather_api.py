@@ -22,12 +22,81 @@ Note: You'll need to sign up for a free API key at weatherapi.com
 """
 
 import os
+import atexit
+import ssl
 import sys
-import requests
-from dotenv import load_dotenv
+import certifi
+import httpx
 
-# Load environment variables from .env file
-load_dotenv()
+# orjson parses faster, but the standard library parser works just as well without it
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+def _load_env(path=".env"):
+    """Copy KEY=VALUE lines from a .env file into os.environ, keeping variables that are already set."""
+    if not os.path.exists(path):
+        return
+    with open(path) as env_file:
+        for line in env_file:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            key, sep, value = line.partition("=")
+            if sep:
+                os.environ.setdefault(key.strip(), value.strip().strip("'\""))
+
+# Load environment variables from .env file (working directory, then project root)
+_load_env()
+_load_env(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, ".env"))
+
+# TLS context built once per process, with certifi's CA bundle loaded a single time
+_SSL_CONTEXT = ssl.create_default_context(cafile=certifi.where())
+
+# Shared HTTP/2 client: keeps the connection alive between calls and retries failed connection attempts
+CLIENT = httpx.Client(
+    transport=httpx.HTTPTransport(
+        http2=True,
+        verify=_SSL_CONTEXT,
+        limits=httpx.Limits(max_keepalive_connections=10),
+        retries=3
+    ),
+    timeout=10.0,
+    headers={"User-Agent": "disco-weather/1.0", "Accept": "application/json"}
+)
+atexit.register(CLIENT.close)
+
+def save_env_value(key, value, path=".env"):
+    """
+    Set KEY=value in a .env file, keeping any other lines it already contains.
+    
+    The file is written to a temporary file first and then atomically renamed,
+    so an interrupted run never leaves a half-written .env behind. The result
+    is only readable by the current user, since it holds API keys.
+    """
+    lines = []
+    if os.path.exists(path):
+        with open(path) as env_file:
+            lines = env_file.read().splitlines()
+    
+    # Update the existing entry in place, or add it at the end
+    entry = f"{key}={value}"
+    for index, line in enumerate(lines):
+        if line.partition("=")[0].strip() == key:
+            lines[index] = entry
+            break
+    else:
+        lines.append(entry)
+    
+    tmp_path = path + ".tmp"
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "w") as env_file:
+        env_file.write("\n".join(lines) + "\n")
+        env_file.flush()
+        os.fsync(env_file.fileno())
+    os.replace(tmp_path, path)
+    os.chmod(path, 0o600)
 
 def test_api_connection():
     """Test connection to the WeatherAPI and verify library installation."""
@@ -41,8 +110,7 @@ def test_api_connection():
         api_key = input("Please enter your WeatherAPI.com API key: ")
         
         # Save it to a .env file for future use
-        with open(".env", "w") as env_file:
-            env_file.write(f"WEATHER_API_KEY={api_key}")
+        save_env_value("WEATHER_API_KEY", api_key)
         print("API key saved to .env file for future use.")
     
     try:
@@ -55,11 +123,11 @@ def test_api_connection():
         }
         
         print("Sending request to WeatherAPI.com...")
-        response = requests.get(url, params=params)
+        response = CLIENT.get(url, params=params)
         
         # Check if request was successful
         if response.status_code == 200:
-            data = response.json()
+            data = json_loads(response.content)
             print("\nAPI connection successful! Response received.")
             
             # Extract and display the weather data
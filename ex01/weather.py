@@ -8,20 +8,66 @@ This script asks for latitude and longitude coordinates and displays
 the current weather information for that location using WeatherAPI.com.
  
 Requirements:
-    - requests library (install with pip install requests)
+    - httpx with HTTP/2 support (install with pip install "httpx[http2]"), and optionally orjson
     - Python virtual environment with necessary packages
     - API key from WeatherAPI.com stored in .env file
 """
 
 import os
+import atexit
+import ssl
 import sys
-import requests
-from dotenv import load_dotenv
+import threading
+import urllib.parse
+import certifi
+import httpx
 
-# Load API key from .env file
-load_dotenv()
+# orjson parses faster, but the standard library parser works just as well without it
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+def _load_env(path=".env"):
+    """Copy KEY=VALUE lines from a .env file into os.environ, keeping variables that are already set."""
+    if not os.path.exists(path):
+        return
+    with open(path) as env_file:
+        for line in env_file:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            key, sep, value = line.partition("=")
+            if sep:
+                os.environ.setdefault(key.strip(), value.strip().strip("'\""))
+
+# Load API key from .env file (working directory, then project root)
+_load_env()
+_load_env(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, ".env"))
 API_KEY = os.getenv("WEATHER_API_KEY")
 
+# WeatherAPI request URL with the fixed parameters already encoded; only the location is appended
+_WX_URL_PREFIX = f"https://api.weatherapi.com/v1/current.json?key={urllib.parse.quote(API_KEY or '', safe='')}&aqi=no&q="
+
+# TLS context built once per process, with certifi's CA bundle loaded a single time
+_SSL_CONTEXT = ssl.create_default_context(cafile=certifi.where())
+
+# Shared HTTP/2 client: keeps the connection alive between calls and retries failed connection attempts
+CLIENT = httpx.Client(
+    transport=httpx.HTTPTransport(
+        http2=True,
+        verify=_SSL_CONTEXT,
+        limits=httpx.Limits(max_keepalive_connections=10),
+        retries=3
+    ),
+    timeout=10.0,
+    headers={"User-Agent": "disco-weather/1.0", "Accept": "application/json"}
+)
+atexit.register(CLIENT.close)
+
+# Largest absolute value accepted for each coordinate
+_COORDINATE_LIMITS = {'latitude': 90.0, 'longitude': 180.0}
+
 def validate_coordinates(value, coord_type):
     """
     Validate latitude or longitude input.
@@ -38,16 +84,29 @@ def validate_coordinates(value, coord_type):
     """
     try:
         coordinate = float(value)
-        
-        # Check range
-        if coord_type == 'latitude' and (coordinate < -90 or coordinate > 90):
-            raise ValueError("Latitude must be between -90 and 90 degrees")
-        elif coord_type == 'longitude' and (coordinate < -180 or coordinate > 180):
-            raise ValueError("Longitude must be between -180 and 180 degrees")
-            
-        return coordinate
     except ValueError:
-        raise ValueError(f"Invalid {coord_type} format. Please enter a number.")
+        raise ValueError(f"Invalid {coord_type} format. Please enter a number.") from None
+    
+    # Check range (written as "not <=" so that nan is rejected too)
+    limit = _COORDINATE_LIMITS[coord_type]
+    if not abs(coordinate) <= limit:
+        raise ValueError(f"{coord_type.capitalize()} must be between -{limit:g} and {limit:g} degrees")
+        
+    return coordinate
+
+def _read_error_body(response, limit=512):
+    """
+    Read at most `limit` bytes of an error response, for display.
+    
+    Error pages can be large HTML documents; there is no need to download
+    and decode all of them just to show the first lines.
+    """
+    body = b""
+    for chunk in response.iter_bytes():
+        body += chunk
+        if len(body) >= limit:
+            break
+    return body[:limit].decode(response.charset_encoding or "utf-8", errors="replace")
 
 def get_weather(latitude, longitude):
     """
@@ -65,26 +124,20 @@ def get_weather(latitude, longitude):
         return None
     
     try:
-        # Construct the API request
-        url = "https://api.weatherapi.com/v1/current.json"
-        params = {
-            "key": API_KEY,
-            "q": f"{latitude},{longitude}",
-            "aqi": "no"
-        }
+        # Construct the API request (the comma of "lat,lon" is kept as is)
+        url = _WX_URL_PREFIX + urllib.parse.quote(f"{latitude},{longitude}", safe=",")
         
         # Send the request
-        response = requests.get(url, params=params, timeout=10)
-        
-        # Check if the request was successful
-        if response.status_code == 200:
-            return response.json()
-        else:
-            print(f"Error: API request failed with status code {response.status_code}")
-            print(f"Response: {response.text}")
-            return None
+        with CLIENT.stream("GET", url) as response:
+            # Check if the request was successful
+            if response.status_code == 200:
+                return json_loads(response.read())
+            else:
+                print(f"Error: API request failed with status code {response.status_code}")
+                print(f"Response: {_read_error_body(response)}")
+                return None
             
-    except requests.exceptions.RequestException as e:
+    except httpx.HTTPError as e:
         print(f"Error: Failed to connect to the weather API: {e}")
         return None
     except Exception as e:
@@ -120,11 +173,21 @@ def display_weather(weather_data):
     print(f"\nLocation: {location['name']}, {location['region']}, {location['country']}")
     print(f"Local time: {location['localtime']}")
 
+def warm_up():
+    """Open the connection to WeatherAPI ahead of time, while the user is still typing."""
+    try:
+        CLIENT.head("https://api.weatherapi.com/v1/", timeout=5)
+    except httpx.HTTPError:
+        pass
+
 def main():
     """Main function to run the weather information program."""
     print("Weather Information Program")
     print("==========================")
     
+    # TCP and TLS setup overlap with the time spent typing, instead of delaying the lookup
+    threading.Thread(target=warm_up, daemon=True).start()
+    
     # Ask for latitude and longitude
     try:
         # Get latitude with validation
@@ -0,0 +1,66 @@
+"""
+Shared helpers for the ex03 scripts: .env loading, the TLS context and Groq clients.
+
+The TLS context and the clients are created on first use and then reused, so
+every call made from the same process goes through the same connection pool.
+"""
+
+import os
+import ssl
+from functools import lru_cache
+
+# Connection settings of the clients. With HTTP/2, concurrent Groq calls are
+# multiplexed over one connection instead of opening one connection each
+_MAX_KEEPALIVE_CONNECTIONS = 5
+_MAX_CONNECTIONS = 10
+_TIMEOUT = 30.0
+
+def _load_env(path=".env"):
+    """Copy KEY=VALUE lines from a .env file into os.environ, keeping variables that are already set."""
+    if not os.path.exists(path):
+        return
+    with open(path) as env_file:
+        for line in env_file:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            key, sep, value = line.partition("=")
+            if sep:
+                os.environ.setdefault(key.strip(), value.strip().strip("'\""))
+
+def load_env():
+    """Load the .env file of the working directory, then the one of the project root."""
+    _load_env()
+    _load_env(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, ".env"))
+
+@lru_cache(maxsize=None)
+def get_ssl_context():
+    """Return the process-wide TLS context, with certifi's CA bundle loaded a single time."""
+    import certifi
+    
+    return ssl.create_default_context(cafile=certifi.where())
+
+@lru_cache(maxsize=None)
+def get_client():
+    """Return the process-wide synchronous Groq client."""
+    # The SDK (pydantic, httpx) takes a while to import, so it is only loaded when needed
+    import httpx
+    from groq import Groq
+    
+    limits = httpx.Limits(max_keepalive_connections=_MAX_KEEPALIVE_CONNECTIONS, max_connections=_MAX_CONNECTIONS)
+    return Groq(
+        api_key=os.getenv("GROQ_API_KEY"),
+        http_client=httpx.Client(http2=True, verify=get_ssl_context(), limits=limits, timeout=_TIMEOUT)
+    )
+
+@lru_cache(maxsize=None)
+def get_async_client():
+    """Return the process-wide asynchronous Groq client."""
+    import httpx
+    from groq import AsyncGroq
+    
+    limits = httpx.Limits(max_keepalive_connections=_MAX_KEEPALIVE_CONNECTIONS, max_connections=_MAX_CONNECTIONS)
+    return AsyncGroq(
+        api_key=os.getenv("GROQ_API_KEY"),
+        http_client=httpx.AsyncClient(http2=True, verify=get_ssl_context(), limits=limits, timeout=_TIMEOUT)
+    )
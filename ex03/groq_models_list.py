@@ -10,17 +10,14 @@
 #                                                                              #
 # **************************************************************************** #
 
-import os
-from groq import Groq
-from dotenv import load_dotenv
+from _groq_client import get_client, load_env
 
-# Load API key
-load_dotenv()
-client = Groq(api_key=os.getenv("GROQ_API_KEY"))
+# Load API key (working directory, then project root)
+load_env()
 
 # List models
 try:
-    models = client.models.list()
+    models = get_client().models.list()
     print("Available Models on Groq:")
     for model in models.data:
         print(f"- {model.id}")
@@ -14,13 +14,35 @@
 # weather_bot_groq.py
 
 import os
+import re
+import json
 import sys
-import requests
-from groq import Groq
-from dotenv import load_dotenv
+import urllib.parse
+import asyncio
+import hashlib
+import threading
+from functools import lru_cache
+from cachetools import TTLCache
+from _groq_client import get_async_client, get_ssl_context, load_env
 
-# Load environment variables
-load_dotenv()
+# orjson is faster, but the standard library gives the same results when it is not installed
+try:
+    import orjson
+    
+    json_loads = orjson.loads
+    
+    def json_dumps(obj):
+        """Serialize obj to a compact JSON string."""
+        return orjson.dumps(obj).decode()
+except ImportError:
+    json_loads = json.loads
+    
+    def json_dumps(obj):
+        """Serialize obj to a compact JSON string."""
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+# Load environment variables (working directory, then project root)
+load_env()
 
 # API keys
 WEATHER_API_KEY = os.getenv("WEATHER_API_KEY")
@@ -35,205 +57,573 @@ if not GROQ_API_KEY:
     print("Error: Groq API key not found. Please add GROQ_API_KEY to your .env file.")
     sys.exit(1)
 
-# Initialize Groq client
-client = Groq(api_key=GROQ_API_KEY)
+# WeatherAPI request URL with the fixed parameters already encoded; only the location is appended
+_WX_URL_PREFIX = f"https://api.weatherapi.com/v1/current.json?key={urllib.parse.quote(WEATHER_API_KEY, safe='')}&aqi=no&q="
+
+# TLS context built once per process and shared with the Groq clients
+_SSL_CONTEXT = get_ssl_context()
+
+# Weather data cached per location for 10 minutes; unknown locations are remembered for 1 minute
+_WX_CACHE = TTLCache(maxsize=256, ttl=600)
+_WX_MISS_CACHE = TTLCache(maxsize=256, ttl=60)
+
+# Bulk lookups are not part of every WeatherAPI plan: once the key is refused access to them,
+# locations are fetched one by one for the rest of the session
+_bulk_available = True
+
+# Query classifications cached for 1 hour, keyed by a digest of the normalized query
+_LLM_CACHE = TTLCache(maxsize=512, ttl=3600)
+
+# Complete answers cached for 2 minutes, keyed by the normalized question
+_RESPONSE_CACHE = TTLCache(maxsize=256, ttl=120)
+
+# System prompts of the classifier and the answer, kept together so they are easy to find and edit
+CLASSIFY_SYSTEM_PROMPT = (
+    'Respond with JSON {"is_weather": bool, "locations": [string]}. '
+    '"is_weather" tells if the query asks about weather or meteorological conditions; '
+    '"locations" lists every place mentioned in the query, or is empty if there is none.'
+)
+RESPONSE_SYSTEM_PROMPT = "Weather assistant. Answer the question conversationally using the JSON facts; reply in 2-3 sentences."
+
+# Basic sentence used if Groq API fails, filled from the WeatherAPI 'location' and 'current' fields
+_FALLBACK_TMPL = ("The current weather in {name} is a temperature of {temp_c} degrees (C), a humidity of {humidity}%, "
+                  "{clouds} in the sky and a wind of {wind_kph}km/h.")
+
+# Commands that end the conversation
+_EXIT = frozenset(("exit", "quit", "bye", "goodbye"))
+
+# Words that make a question obviously about the weather. Words with other common meanings
+# ("a cold", "temp jobs", "cloud providers", "wind farms", "business climate", "sales
+# forecast") are left out, the LLM handles those queries
+_WEATHER_WORDS = (
+    r"\b(?:weather|temperatures?|rain(?:y|ing)?|snow(?:y|ing)?|sunny|cloudy|"
+    r"humid(?:ity)?|windy|storm(?:s|y)?|fog(?:gy)?|precipitation)\b"
+)
+_WEATHER_WORD_RE = re.compile(_WEATHER_WORDS, re.I)
+
+# Templated questions such as "What's the weather like in Tokyo right now?" or "Is it snowing
+# in Oslo?": a weather word, then the place after "in", running to the end of the query
+# (minus a trailing time expression)
+_LOCATION_RE = re.compile(
+    _WEATHER_WORDS + r"[^.?!]*?\bin\s+"
+    r"(?!(?:my|your|our|his|her|their|a|an)\b)([^\W\d_][\w .,'-]*?)"
+    r"(?:,?\s+(?:right now|now|currently|at the moment|today|tonight|tomorrow|this \w+|next \w+))?"
+    r"\s*[?.!]*\s*$",
+    re.I
+)
+_SEVERAL_LOCATIONS_RE = re.compile(r"\b(?:and|or|vs|versus)\b", re.I)
+
+# Words that do not belong in a place name: "Paris compared to London", "Denver by Friday"
+# or "Moscow at night" still need the LLM (or the city lookup) to find the place
+_NOT_PLACE_RE = re.compile(
+    r"\b(?:in|at|by|on|for|to|from|with|without|near|around|during|before|after|until|since|"
+    r"compared|than|like|if|when|while|because|but|so|is|are|was|will|be|here|there|any)\b",
+    re.I
+)
+
+# Longer queries go straight to the LLM, which also keeps the regexes above fast
+_FAST_PATH_MAX_CHARS = 200
+
+# Words of a query, for the city lookup ("What's", "Saint-Denis" and "São" are one word each)
+_WORD_RE = re.compile(r"[^\W\d_]+(?:['-][^\W\d_]+)*")
+
+# Words usually followed by a place name, and words that join place names
+_BEFORE_PLACE_WORDS = frozenset(("in", "and", "or", "vs", "versus"))
+_JOIN_PLACE_WORDS = frozenset(("and", "or", "vs", "versus"))
+
+# Common words of weather questions that are never a place ("What", "today", "like", ...)
+_QUERY_WORDS = frozenset((
+    "what", "what's", "whats", "how", "how's", "hows", "which", "where", "when", "who", "why",
+    "is", "isn't", "are", "was", "will", "would", "could", "can", "should", "do", "does", "did",
+    "tell", "show", "give", "compare", "compared", "please", "hey", "hi", "hello",
+    "i", "i'm", "me", "my", "we", "you", "it", "it's", "there", "here", "the", "a", "an", "any",
+    "of", "about", "for", "to", "at", "in", "on", "like", "than", "be", "going", "much", "so",
+    "now", "right", "currently", "today", "tonight", "tomorrow", "this", "next", "weekend",
+    "morning", "afternoon", "evening", "night", "week",
+))
 
-def get_weather_by_location(location_name):
+async def _read_error_body(response, limit=512):
+    """Read at most `limit` bytes of an error response, for display."""
+    body = b""
+    async for chunk in response.aiter_bytes():
+        body += chunk
+        if len(body) >= limit:
+            break
+    return body[:limit].decode(response.charset_encoding or "utf-8", errors="replace")
+
+async def get_weather_by_location(session, location_name):
     """
     Get current weather data for the given location name.
     
     Args:
+        session (httpx.AsyncClient): The shared HTTP client
         location_name (str): The name of the location (city, address, etc.)
         
     Returns:
         dict: Weather data if successful, None otherwise
     """
+    # Serve repeated questions about the same place from the cache
+    key = location_name.strip().casefold()
+    weather_data = _WX_CACHE.get(key)
+    if weather_data is not None:
+        return weather_data
+    if key in _WX_MISS_CACHE:
+        return None
+    
     try:
-        # Construct the API request
-        url = "https://api.weatherapi.com/v1/current.json"
-        params = {
-            "key": WEATHER_API_KEY,
-            "q": location_name,
-            "aqi": "no"
-        }
+        # Construct the API request (commas, as in "City, Country", are kept as is)
+        url = _WX_URL_PREFIX + urllib.parse.quote(location_name, safe=",")
         
         # Send the request
-        response = requests.get(url, params=params, timeout=10)
-        
-        # Check if the request was successful
-        if response.status_code == 200:
-            return response.json()
-        elif response.status_code == 400:
-            # This typically means the location wasn't found
-            return None
-        else:
-            print(f"Error: API request failed with status code {response.status_code}")
-            print(f"Response: {response.text}")
-            return None
+        async with session.stream("GET", url) as response:
+            # Check if the request was successful
+            if response.status_code == 200:
+                weather_data = json_loads(await response.aread())
+                _WX_CACHE[key] = weather_data
+                return weather_data
+            elif response.status_code == 400:
+                # This typically means the location wasn't found
+                _WX_MISS_CACHE[key] = True
+                return None
+            else:
+                print(f"Error: API request failed with status code {response.status_code}")
+                print(f"Response: {await _read_error_body(response)}")
+                return None
             
     except Exception as e:
         print(f"Error connecting to weather API: {e}")
         return None
 
-def extract_location_from_query(query):
+async def prefetch_weather_bulk(session, locations):
     """
-    Use Groq to extract location information from a user query.
+    Fill the weather caches for several locations with a single bulk request.
+    
+    Found locations go to _WX_CACHE and unknown ones to _WX_MISS_CACHE. Locations
+    the request did not answer, for example because it failed, are left out of both.
     
     Args:
-        query (str): The user's question
-        
-    Returns:
-        str: The extracted location, or None if no location found
+        session (httpx.AsyncClient): The shared HTTP client
+        locations (list): The names of the locations
     """
+    global _bulk_available
+    
+    # The position of each location is sent as its id, so duplicated names cannot be mixed up
+    payload = {"locations": [{"q": location, "custom_id": str(i)} for i, location in enumerate(locations)]}
     try:
-        prompt = f"""
-        Extract the location from this weather-related query. Return ONLY the location name, nothing else.
-        If no location is mentioned or you're unsure, return only the word "UNKNOWN".
-        
-        User query: {query}
+        response = await session.post(
+            _WX_URL_PREFIX + "bulk",
+            content=json_dumps(payload),
+            headers={"Content-Type": "application/json"}
+        )
+    except Exception as e:
+        print(f"Error connecting to weather API: {e}")
+        return
+    
+    if response.status_code != 200:
+        # 401 and 403 mean the key or its plan cannot use bulk lookups; anything else
+        # (rate limit, server error) may pass, so bulk is tried again next time
+        if response.status_code in (401, 403):
+            _bulk_available = False
+        return
+    
+    try:
+        items = json_loads(response.content).get("bulk")
+    except (ValueError, AttributeError):
+        items = None
+    if not isinstance(items, list):
+        print("Error: unexpected response to the weather API bulk request")
+        return
+    
+    for item in items:
+        query = item.get("query") if isinstance(item, dict) else None
+        if not isinstance(query, dict):
+            continue
+        try:
+            i = int(query.get("custom_id"))
+        except (TypeError, ValueError):
+            continue
+        if not 0 <= i < len(locations):
+            continue
         
-        Location:
-        """
+        key = locations[i].strip().casefold()
+        if "location" in query and "current" in query:
+            _WX_CACHE[key] = {"location": query["location"], "current": query["current"]}
+        else:
+            # An error entry typically means the location wasn't found
+            _WX_MISS_CACHE[key] = True
+
+async def get_weather_for_locations(session, locations):
+    """
+    Get current weather data for all the given locations.
+    
+    Cached locations are served from the cache. When several others remain,
+    a bulk request first adds them to the cache, then any location it did not
+    answer is fetched on its own.
+    
+    Args:
+        session (httpx.AsyncClient): The shared HTTP client
+        locations (list): The names of the locations
         
-        # Call Groq API with the LLaMA model (you can also use "mixtral-8x7b-32768" for better results)
-        response = client.chat.completions.create(
-            model="llama3-70b-8192",
-            messages=[
-                {"role": "system", "content": "You extract location names from queries."},
-                {"role": "user", "content": prompt}
-            ],
-            max_tokens=20,
-            temperature=0.1
-        )
+    Returns:
+        list: Weather data for each location in order, None where it is not available
+    """
+    pending = []
+    for location in locations:
+        key = location.strip().casefold()
+        if key not in _WX_CACHE and key not in _WX_MISS_CACHE:
+            pending.append(location)
+    
+    if len(pending) > 1 and _bulk_available:
+        await prefetch_weather_bulk(session, pending)
+    
+    # Served from the cache where possible, otherwise fetched concurrently, one request per location
+    return await asyncio.gather(*(get_weather_by_location(session, location) for location in locations))
+
+@lru_cache(maxsize=None)
+def _cities():
+    """Return the lowercase city names of cities.txt, loaded the first time they are needed."""
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "cities.txt")
+    try:
+        with open(path, encoding="utf-8") as cities_file:
+            return frozenset(line.strip() for line in cities_file if line.strip() and not line.startswith("#"))
+    except OSError:
+        return frozenset()
+
+@lru_cache(maxsize=None)
+def _city_max_words():
+    """Return the number of words of the longest city name of cities.txt."""
+    return max((name.count(" ") + 1 for name in _cities()), default=0)
+
+def find_cities(query):
+    """
+    Find the well-known cities named in a query, using the gazetteer of cities.txt.
+    
+    Args:
+        query (str): The user's question
         
-        location = response.choices[0].message.content.strip()
+    Returns:
+        list: The cities as written in the query, or None if some other place may be named
+    """
+    words = [(match.group(), match.start()) for match in _WORD_RE.finditer(query)]
+    cities = _cities()
+    max_words = _city_max_words()
+    
+    def city_length(i):
+        """Return how many words starting at words[i] form a known city, 0 if none."""
+        # The longest name wins, so "New York City" is not read as "York"
+        for n in range(min(max_words, len(words) - i), 0, -1):
+            if " ".join(word for word, _ in words[i:i + n]).casefold() in cities:
+                return n
+        return 0
+    
+    names = []
+    after_city = False
+    i = 0
+    while i < len(words):
+        n = city_length(i)
+        if n:
+            names.append(query[words[i][1]:words[i + n - 1][1] + len(words[i + n - 1][0])])
+            i += n
+            after_city = True
+            continue
         
-        # If Groq responded with "UNKNOWN", return None
-        if location.upper() == "UNKNOWN":
+        # A word that may be a place we do not know ("Springfield") leaves the query to the LLM:
+        # any word right after "in", and an unknown word that is capitalized, next to a city,
+        # or joined to another place by "and", "or" or "vs"
+        word = words[i][0]
+        lowered = word.casefold()
+        if i and words[i - 1][0].casefold() in _BEFORE_PLACE_WORDS:
             return None
-            
-        return location
+        if lowered not in _QUERY_WORDS and lowered not in _JOIN_PLACE_WORDS and not _WEATHER_WORD_RE.fullmatch(word):
+            next_word = words[i + 1][0].casefold() if i + 1 < len(words) else ""
+            if word[0].isupper() or after_city or next_word in _JOIN_PLACE_WORDS or city_length(i + 1):
+                return None
+        after_city = False
+        i += 1
+    
+    # Keep the order of the query, skipping duplicates
+    locations = []
+    for name in names:
+        if name.casefold() not in (location.casefold() for location in locations):
+            locations.append(name)
+    return locations or None
+
+def fast_extract(query):
+    """
+    Extract the locations of an obvious weather question without calling Groq.
+    
+    Args:
+        query (str): The user's question
         
-    except Exception as e:
-        print(f"Error connecting to Groq API: {e}")
+    Returns:
+        list: The locations, or None if the query has to go through the LLM
+    """
+    if len(query) > _FAST_PATH_MAX_CHARS:
         return None
+    
+    match = _LOCATION_RE.search(query)
+    if match:
+        location = match.group(1).strip(" ,")
+        
+        # "Paris and Tokyo" or "Paris compared to London" is split by the city lookup below,
+        # or else by the LLM
+        if location and not _SEVERAL_LOCATIONS_RE.search(location) and not _NOT_PLACE_RE.search(location):
+            return [location]
+    
+    # Otherwise a weather word and well-known city names are enough ("Tokyo weather today?")
+    if not _WEATHER_WORD_RE.search(query):
+        return None
+    return find_cities(query)
 
-def is_weather_query(query):
+async def classify_and_extract(query):
     """
-    Use Groq to determine if a query is weather-related.
+    Use a single Groq call to decide if a query is weather-related and extract its locations.
     
     Args:
         query (str): The user's question
         
     Returns:
-        bool: True if the query is about weather, False otherwise
+        dict: {"is_weather": bool, "locations": list of str (empty if none found)}
     """
+    # Repeated questions ("Weather in Paris?", "weather in paris? ") skip Groq entirely
+    key = hashlib.blake2b(query.strip().casefold().encode(), digest_size=16).hexdigest()
+    classification = _LLM_CACHE.get(key)
+    if classification is not None:
+        return classification
+    
     try:
-        prompt = f"""
-        Is this query asking about weather or meteorological conditions?
-        Answer with ONLY "YES" or "NO", nothing else.
-        
-        User query: {query}
-        """
-        
-        response = client.chat.completions.create(
-            model="llama3-70b-8192",
+        # A small model is enough for this classification; the large one is kept for the answers
+        response = await get_async_client().chat.completions.create(
+            model="llama-3.1-8b-instant",
+            response_format={"type": "json_object"},
             messages=[
-                {"role": "system", "content": "You determine if queries are weather-related."},
-                {"role": "user", "content": prompt}
+                {"role": "system", "content": CLASSIFY_SYSTEM_PROMPT},
+                {"role": "user", "content": query}
             ],
-            max_tokens=5,
-            temperature=0.1
+            max_tokens=60,
+            temperature=0  # Deterministic output, so the same query always classifies the same way
         )
         
-        is_weather = response.choices[0].message.content.strip()
-        return is_weather.upper() == "YES"
+        result = json_loads(response.choices[0].message.content)
+        
+        names = result.get("locations")
+        if isinstance(names, str):
+            names = [names]
+        elif not isinstance(names, list):
+            names = []
+        
+        # Keep the order of the query, skipping blanks and duplicates
+        locations = []
+        for name in names:
+            if not isinstance(name, str):
+                continue
+            name = name.strip()
+            if name and name.upper() != "UNKNOWN" and name.casefold() not in (l.casefold() for l in locations):
+                locations.append(name)
+            
+        classification = {"is_weather": bool(result.get("is_weather")), "locations": locations}
+        _LLM_CACHE[key] = classification
+        return classification
         
     except Exception as e:
         print(f"Error connecting to Groq API: {e}")
         # If there's an error, we'll assume it's a weather query to be safe
-        return True
+        return {"is_weather": True, "locations": []}
 
-def generate_weather_response(query, weather_data):
+def basic_weather_response(weather_list):
     """
-    Use Groq to generate a natural language response about the weather.
+    Describe the weather with a basic sentence per location, used if Groq API fails.
     
     Args:
-        query (str): The user's original question
-        weather_data (dict): Weather data from the API
+        weather_list (list): Weather data from the API, one dict per location
         
     Returns:
-        str: A natural language response
+        str: The description
     """
-    # Extract relevant weather information
-    location = weather_data['location']['name']
-    country = weather_data['location']['country']
-    temperature = weather_data['current']['temp_c']
-    humidity = weather_data['current']['humidity']
-    cloud = weather_data['current']['cloud']
-    wind = weather_data['current']['wind_kph']
-    condition = weather_data['current']['condition']['text']
-    
-    # Create a context with the weather data
-    weather_context = f"""
-    Location: {location}, {country}
-    Temperature: {temperature}°C
-    Humidity: {humidity}%
-    Cloud Cover: {cloud}%
-    Wind Speed: {wind} km/h
-    Condition: {condition}
+    sentences = []
+    for weather_data in weather_list:
+        current_d = weather_data['current']
+        sentences.append(_FALLBACK_TMPL.format_map({
+            **weather_data['location'], **current_d,
+            'clouds': 'there are a lot of clouds' if current_d['cloud'] > 50 else 'there are few clouds'
+        }))
+    return " ".join(sentences)
+
+async def generate_weather_response(query, weather_list):
     """
+    Use Groq to generate a natural language response about the weather.
     
-    try:
-        prompt = f"""
-        User question: {query}
+    The response is streamed, so the first words can be shown while the rest
+    is still being generated. Errors of the Groq API are raised to the caller,
+    possibly after some pieces were already yielded.
+    
+    Args:
+        query (str): The user's original question
+        weather_list (list): Weather data from the API, one dict per location
         
-        Weather data:
-        {weather_context}
+    Yields:
+        str: Consecutive pieces of a natural language response
+    """
+    facts = []
+    for weather_data in weather_list:
+        # Extract relevant weather information
+        location_d = weather_data['location']
+        current_d = weather_data['current']
         
-        Provide a natural, conversational response to the user's weather-related question using the provided weather data.
-        Keep your response relatively brief (2-3 sentences) and focused on answering their specific question.
-        """
+        # Create a compact context with the weather data (fewer prompt tokens than labelled text)
+        facts.append({"loc": location_d['name'], "country": location_d['country'], "t_c": current_d['temp_c'],
+                      "rh": current_d['humidity'], "cloud": current_d['cloud'], "wind_kph": current_d['wind_kph'],
+                      "cond": current_d['condition']['text']})
+    
+    weather_context = json_dumps(facts[0] if len(facts) == 1 else facts)
+    prompt = f"{query}\n{weather_context}"
+    
+    stream = await get_async_client().chat.completions.create(
+        model="llama3-70b-8192",  # You could also try "mixtral-8x7b-32768" here
+        messages=[
+            {"role": "system", "content": RESPONSE_SYSTEM_PROMPT},
+            {"role": "user", "content": prompt}
+        ],
+        max_tokens=150 * len(weather_list),
+        temperature=0.7,
+        stream=True
+    )
+    
+    started = False
+    async for chunk in stream:
+        if not chunk.choices:
+            continue
+        text = chunk.choices[0].delta.content or ""
+        # Drop the leading whitespace the model sometimes starts with
+        if not started:
+            text = text.lstrip()
+            started = bool(text)
+        if text:
+            yield text
+
+async def handle_user_query(session, query):
+    """
+    Process a user's query about weather.
+    
+    Yields:
+        str: Consecutive pieces of the reply, as soon as they are available
+    """
+    # The same question asked again within a short time gets the same answer
+    key = query.strip().casefold()
+    response = _RESPONSE_CACHE.get(key)
+    if response is not None:
+        yield response
+        return
+    
+    # Templated questions and well-known cities next to a weather keyword need no LLM at all
+    locations = fast_extract(query)
+    if locations:
+        results = await get_weather_for_locations(session, locations)
+        # A guess WeatherAPI does not know ("Paris tomorrow afternoon") is left to the LLM instead
+        if not all(results):
+            locations = None
+    
+    if not locations:
+        # Classify the query and extract the location in one round-trip
+        classification = await classify_and_extract(query)
         
-        response = client.chat.completions.create(
-            model="llama3-70b-8192",  # You could also try "mixtral-8x7b-32768" here
-            messages=[
-                {"role": "system", "content": "You are a helpful weather assistant. You provide natural, conversational responses to weather-related questions using provided weather data."},
-                {"role": "user", "content": prompt}
-            ],
-            max_tokens=150,
-            temperature=0.7
-        )
+        # Check if this is a weather-related query
+        if not classification["is_weather"]:
+            yield "I'm a weather assistant. Please ask me about the weather in a specific location."
+            return
         
-        return response.choices[0].message.content.strip()
+        locations = classification["locations"]
+        if not locations:
+            yield "I couldn't determine which location you're asking about. Could you please specify a city or place?"
+            return
         
+        # Get weather data for all the locations at once
+        results = await get_weather_for_locations(session, locations)
+    weather_list = [weather_data for weather_data in results if weather_data]
+    missing = ", ".join(f"'{location}'" for location, weather_data in zip(locations, results) if not weather_data)
+    
+    if not weather_list:
+        yield f"I couldn't find weather information for {missing}. Please check the spelling or try a different location."
+        return
+    
+    parts = []
+    if missing:
+        parts.append(f"I couldn't find weather information for {missing}.\n")
+        yield parts[-1]
+    
+    # Generate a natural language response
+    answered = False
+    try:
+        async for text in generate_weather_response(query, weather_list):
+            answered = True
+            parts.append(text)
+            yield text
     except Exception as e:
+        if answered:
+            # Finish the partial line before reporting the error
+            print()
         print(f"Error connecting to Groq API: {e}")
-        # Fallback to a basic response if Groq API fails
-        return f"The current weather in {location} is a temperature of {temperature} degrees (C), a humidity of {humidity}%, {'there are a lot of clouds' if cloud > 50 else 'there are few clouds'} in the sky and a wind of {wind}km/h."
+        # Fallback to a basic response if Groq API fails before answering
+        if not answered:
+            yield basic_weather_response(weather_list)
+        # Only complete answers are cached, so the next attempt can succeed
+        return
+    
+    _RESPONSE_CACHE[key] = "".join(parts)
+
+async def warm_up(request):
+    """
+    Send a throwaway request so its connection is already open for the first question.
+    
+    Args:
+        request (callable): Returns the request coroutine; its result and any error are ignored
+    """
+    try:
+        await request()
+    except Exception:
+        pass
 
-def handle_user_query(query):
-    """Process a user's query about weather."""
-    # Check if this is a weather-related query
-    if not is_weather_query(query):
-        return "I'm a weather assistant. Please ask me about the weather in a specific location."
+async def read_input(prompt):
+    """
+    Read a line from stdin without blocking the event loop.
     
-    # Extract location from the query
-    location = extract_location_from_query(query)
+    input() runs in a daemon thread so that pressing Ctrl+C never leaves the
+    interpreter waiting for a pending read at exit.
     
-    if not location:
-        return "I couldn't determine which location you're asking about. Could you please specify a city or place?"
+    Args:
+        prompt (str): The prompt to display
+        
+    Returns:
+        str: The line entered by the user
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
     
-    # Get weather data for the location
-    weather_data = get_weather_by_location(location)
+    def resolve(result, error):
+        # Runs on the event loop; the read may have been cancelled meanwhile
+        if future.done():
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
     
-    if not weather_data:
-        return f"I couldn't find weather information for '{location}'. Please check the spelling or try a different location."
+    def reader():
+        result, error = None, None
+        try:
+            result = input(prompt)
+        except BaseException as e:
+            error = e
+        try:
+            loop.call_soon_threadsafe(resolve, result, error)
+        except RuntimeError:
+            # The event loop has already been closed
+            pass
     
-    # Generate a natural language response
-    return generate_weather_response(query, weather_data)
+    threading.Thread(target=reader, daemon=True).start()
+    return await future
 
-def main():
+async def main():
     """Main function to run the weather chatbot."""
     print("Weather Chatbot (Groq Version)")
     print("==============================")
@@ -241,32 +631,71 @@ def main():
     print("Type 'exit' or 'quit' to end the conversation.")
     print()
     
-    # Main conversation loop
-    while True:
-        try:
-            user_input = input("Ask?: ")
-            
-            # Check for exit command
-            if user_input.lower() in ['exit', 'quit', 'bye', 'goodbye']:
-                print("Goodbye! Have a great day!")
-                break
+    # Imported only once the banner is on screen, to keep startup snappy
+    import httpx
+    
+    # One HTTP/2 client for the whole conversation, so WeatherAPI requests share a kept-alive connection
+    transport = httpx.AsyncHTTPTransport(
+        http2=True,
+        verify=_SSL_CONTEXT,
+        limits=httpx.Limits(max_connections=20, max_keepalive_connections=10, keepalive_expiry=75),
+        retries=3
+    )
+    async with httpx.AsyncClient(
+        transport=transport,
+        timeout=10.0,
+        headers={"User-Agent": "disco-weather/1.0", "Accept": "application/json"}
+    ) as session:
+        # Do the TCP and TLS handshakes with both APIs while the user types the first question
+        warm_ups = [
+            asyncio.ensure_future(warm_up(lambda: session.head("https://api.weatherapi.com/v1/", timeout=5))),
+            # Also loads the Groq SDK, in the background once the prompt is already shown
+            asyncio.ensure_future(warm_up(lambda: get_async_client().models.list()))
+        ]
+        
+        # Main conversation loop
+        while True:
+            try:
+                user_input = await read_input("Ask?: ")
+                cmd = user_input.strip().lower()
                 
-            # Handle empty input
-            if not user_input.strip():
-                print("Please ask a question about the weather.")
-                continue
+                # Check for exit command
+                if cmd in _EXIT:
+                    print("Goodbye! Have a great day!")
+                    break
+                    
+                # Handle empty input
+                if not cmd:
+                    print("Please ask a question about the weather.")
+                    continue
+                    
+                # Process the query and print the response as it arrives
+                async for text in handle_user_query(session, user_input):
+                    print(text, end="", flush=True)
+                print()
+                print()
                 
-            # Process the query and get a response
-            response = handle_user_query(user_input)
-            print(response)
-            print()
-            
-        except KeyboardInterrupt:
-            print("\nGoodbye! Have a great day!")
-            break
-        except Exception as e:
-            print(f"An error occurred: {e}")
-            print("Please try again with a different question.")
+            except (KeyboardInterrupt, EOFError):
+                print("\nGoodbye! Have a great day!")
+                break
+            except Exception as e:
+                print(f"An error occurred: {e}")
+                print("Please try again with a different question.")
+        
+        for task in warm_ups:
+            task.cancel()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    run = asyncio.run
+    # uvloop is a faster drop-in event loop, used when it is installed (it does not support Windows)
+    if sys.platform != "win32":
+        try:
+            import uvloop
+            run = uvloop.run
+        except ImportError:
+            pass
+    
+    try:
+        run(main())
+    except KeyboardInterrupt:
+        print("\nGoodbye! Have a great day!")
\ No newline at end of file